@@ -18,6 +18,7 @@ Lidarr plugin API functions.
 
 from __future__ import annotations
 
+import json
 import re
 
 from http import HTTPStatus
@@ -27,12 +28,19 @@ from typing import TYPE_CHECKING
 import json5  # type: ignore[import]
 import requests
 
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 from buildarr.state import state
 
 from .exceptions import LidarrAPIError
 
 if TYPE_CHECKING:
-    from typing import Any, Dict, Optional, Union
+    from typing import Any, Callable, Dict, Optional, Union
 
     from .secrets import LidarrSecrets
 
@@ -41,6 +49,17 @@ logger = getLogger(__name__)
 
 INITIALIZE_JS_RES_PATTERN = re.compile(r"(?s)^window\.Lidarr = ({.*});$")
 
+_sessions: Dict[str, requests.Session] = {}
+
+json_loads: Callable[[bytes], Any] = orjson.loads if orjson is not None else json.loads
+"""
+Function used to parse the JSON content of Lidarr API responses.
+
+Defaults to `orjson.loads` if `orjson` is installed, otherwise `json.loads`.
+It can be replaced with any function that takes the raw response content
+and raises `ValueError` if it is not valid JSON.
+"""
+
 
 def get_initialize_js(host_url: str, api_key: Optional[str] = None) -> Dict[str, Any]:
     """
@@ -127,15 +146,15 @@ def api_get(
     logger.debug("GET %s", url)
 
     if not session:
-        session = requests.Session()
+        session = _get_session(host_url)
     res = session.get(
         url,
         headers={"X-Api-Key": host_api_key} if host_api_key else None,
         timeout=state.request_timeout,
     )
     try:
-        res_json = res.json()
-    except requests.JSONDecodeError:
+        res_json = _decode_json(res)
+    except ValueError:
         api_error(method="GET", url=url, response=res)
 
     logger.debug("GET %s -> status_code=%i res=%s", url, res.status_code, repr(res_json))
@@ -178,7 +197,7 @@ def api_post(
     logger.debug("POST %s <- req=%s", url, repr(req))
 
     if not session:
-        session = requests.Session()
+        session = _get_session(host_url)
     res = session.post(
         url,
         headers={"X-Api-Key": api_key} if api_key else None,
@@ -186,8 +205,8 @@ def api_post(
         **({"json": req} if req is not None else {}),
     )
     try:
-        res_json = res.json()
-    except requests.JSONDecodeError:
+        res_json = _decode_json(res)
+    except ValueError:
         api_error(method="POST", url=url, response=res)
 
     logger.debug("POST %s -> status_code=%i res=%s", url, res.status_code, repr(res_json))
@@ -230,7 +249,7 @@ def api_put(
     logger.debug("PUT %s <- req=%s", url, repr(req))
 
     if not session:
-        session = requests.Session()
+        session = _get_session(host_url)
     res = session.put(
         url,
         headers={"X-Api-Key": api_key} if api_key else None,
@@ -238,8 +257,8 @@ def api_put(
         timeout=state.request_timeout,
     )
     try:
-        res_json = res.json()
-    except requests.JSONDecodeError:
+        res_json = _decode_json(res)
+    except ValueError:
         api_error(method="PUT", url=url, response=res)
 
     logger.debug("PUT %s -> status_code=%i res=%s", url, res.status_code, repr(res_json))
@@ -277,7 +296,7 @@ def api_delete(
     logger.debug("DELETE %s", url)
 
     if not session:
-        session = requests.Session()
+        session = _get_session(host_url)
     res = session.delete(
         url,
         headers={"X-Api-Key": api_key} if api_key else None,
@@ -290,6 +309,50 @@ def api_delete(
         api_error(method="DELETE", url=url, response=res, parse_response=False)
 
 
+def _get_session(host_url: str) -> requests.Session:
+    """
+    Get the shared session used to send API requests to the given Lidarr instance.
+
+    The session is created on first use, and reused for subsequent requests
+    so that connections to the instance are kept alive between requests.
+
+    Args:
+        host_url (str): Lidarr instance URL.
+
+    Returns:
+        Session for the Lidarr instance
+    """
+
+    try:
+        return _sessions[host_url]
+    except KeyError:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _sessions[host_url] = session
+        return session
+
+
+def _decode_json(response: requests.Response) -> Any:
+    """
+    Decode the JSON body of a Lidarr API response.
+
+    The raw response content is parsed directly using the `json_loads` function.
+
+    Args:
+        response (requests.Response): Response metadata.
+
+    Raises:
+        ValueError: If the response body is not valid JSON
+
+    Returns:
+        Decoded response object
+    """
+
+    return json_loads(response.content)
+
+
 def api_error(
     method: str,
     url: str,
@@ -313,7 +376,7 @@ def api_error(
         f"Unexpected response with status code {response.status_code} from '{method} {url}':"
     )
     if parse_response:
-        res_json = response.json()
+        res_json = _decode_json(response)
         try:
             error_message += f" {_api_error(res_json)}"
         except TypeError:
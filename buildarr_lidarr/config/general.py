@@ -19,7 +19,21 @@ Lidarr plugin general settings configuration.
 from __future__ import annotations
 
 from ipaddress import IPv4Address
-from typing import Any, ClassVar, Dict, List, Literal, Mapping, Optional, Set, Tuple, Union
+from logging import getLogger
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Dict,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 
 from buildarr.config import RemoteMapEntry
 from buildarr.types import BaseEnum, NonEmptyStr, Port, SecretStr
@@ -27,8 +41,18 @@ from pydantic import Field
 from typing_extensions import Annotated, Self
 
 from ..api import api_get, api_put
-from ..secrets import LidarrSecrets
 from .types import LidarrConfigBase
+from .util import (
+    optional_secret_decoder,
+    optional_secret_encoder,
+    optional_str_decoder,
+    optional_str_encoder,
+)
+
+if TYPE_CHECKING:
+    from ..secrets import LidarrSecrets
+
+logger = getLogger(__name__)
 
 
 class AuthenticationMethod(BaseEnum):
@@ -92,16 +116,56 @@ class UpdateMechanism(BaseEnum):
     docker = "docker"
 
 
+def _decode_bind_address(value: str) -> Union[Literal["*"], IPv4Address]:
+    return "*" if value == "*" else IPv4Address(value)
+
+
+def _decode_ignored_addresses(value: Optional[str]) -> Set[str]:
+    # Strip every address in one pass, dropping empty entries (e.g. from a trailing comma).
+    return {addr for addr in map(str.strip, value.split(",")) if addr} if value else set()
+
+
+def _encode_ignored_addresses(value: Set[str]) -> str:
+    return ",".join(sorted(value)) if value else ""
+
+
 class GeneralSettings(LidarrConfigBase):
     """
     Lidarr general settings base class.
     """
 
+    model_config = {
+        **LidarrConfigBase.model_config,
+        # General settings sections are never modified after being created,
+        # so there is no need to validate assignments.
+        "frozen": True,
+        "validate_assignment": False,
+    }
+
     _remote_map: ClassVar[List[RemoteMapEntry]]
 
     @classmethod
     def _from_remote(cls, remote_attrs: Mapping[str, Any]) -> Self:
-        return cls(**cls.get_local_attrs(cls._remote_map, remote_attrs))
+        # The host configuration is returned by Lidarr itself, so skip validation
+        # and construct the model directly. The decoders in `_remote_map` are
+        # responsible for converting remote values to the local attribute types.
+        return cls.model_construct(**cls.get_local_attrs(cls._remote_map, remote_attrs))
+
+    def _managed_attrs_up_to_date(self, remote: Self) -> bool:
+        # This only follows the default rules used by `get_update_remote_attrs`:
+        # attributes explicitly set in the Buildarr configuration are managed,
+        # and are compared using `==`. Remote map entries that override `equals`
+        # or `check_unmanaged` are not supported, so for sections that have them,
+        # always fall back to comparing the attributes individually.
+        if any(
+            "equals" in attr_metadata or "check_unmanaged" in attr_metadata
+            for _, _, attr_metadata in self._remote_map
+        ):
+            return False
+        return all(
+            getattr(self, attr_name) == getattr(remote, attr_name)
+            for attr_name in self.model_fields_set
+        )
 
     def _update_remote_attrs(
         self,
@@ -183,11 +247,15 @@ class HostGeneralSettings(GeneralSettings):
     """
 
     _remote_map: ClassVar[List[RemoteMapEntry]] = [
-        ("bind_address", "bindAddress", {"encoder": lambda v: str(v)}),
+        (
+            "bind_address",
+            "bindAddress",
+            {"decoder": _decode_bind_address, "encoder": str},
+        ),
         ("port", "port", {}),
         ("ssl_port", "sslPort", {}),
         ("use_ssl", "enableSsl", {}),
-        ("url_base", "urlBase", {"decoder": lambda v: v or None, "encoder": lambda v: v or ""}),
+        ("url_base", "urlBase", {"decoder": optional_str_decoder, "encoder": optional_str_encoder}),
         ("instance_name", "instanceName", {}),
     ]
 
@@ -258,8 +326,8 @@ class SecurityGeneralSettings(GeneralSettings):
     """
 
     _remote_map: ClassVar[List[RemoteMapEntry]] = [
-        ("authentication", "authenticationMethod", {}),
-        ("authentication_required", "authenticationRequired", {}),
+        ("authentication", "authenticationMethod", {"decoder": AuthenticationMethod}),
+        ("authentication_required", "authenticationRequired", {"decoder": AuthenticationRequired}),
         (
             "username",
             "username",
@@ -268,9 +336,9 @@ class SecurityGeneralSettings(GeneralSettings):
                 "optional": True,
                 # Due to the validator, gets set to `None` if authentication is disabled
                 # on the remote instance.
-                "decoder": lambda v: v or None,
+                "decoder": optional_str_decoder,
                 # Lidarr isn't too picky about this, but replicate the behaviour of the UI.
-                "encoder": lambda v: v or "",
+                "encoder": optional_str_encoder,
             },
         ),
         (
@@ -281,9 +349,9 @@ class SecurityGeneralSettings(GeneralSettings):
                 "optional": True,
                 # Due to the validator, gets set to `None` if authentication is disabled
                 # on the remote instance.
-                "decoder": lambda v: v or None,
+                "decoder": optional_secret_decoder,
                 # Lidarr isn't too picky about this, but replicate the behaviour of the UI.
-                "encoder": lambda v: v.get_secret_value() if v else "",
+                "encoder": optional_secret_encoder,
             },
         ),
         (
@@ -291,11 +359,12 @@ class SecurityGeneralSettings(GeneralSettings):
             "passwordConfirmation",
             {
                 "optional": True,
-                "decoder": lambda v: v or None,
-                "root_encoder": lambda self: self.password.get_secret_value(),
+                "decoder": optional_secret_decoder,
+                # Always confirm the password being set, using the same encoding.
+                "root_encoder": lambda self: optional_secret_encoder(self.password),
             },
         ),
-        ("certificate_validation", "certificateValidation", {}),
+        ("certificate_validation", "certificateValidation", {"decoder": CertificateValidation}),
     ]
 
 
@@ -357,35 +426,27 @@ class ProxyGeneralSettings(GeneralSettings):
 
     _remote_map: ClassVar[List[RemoteMapEntry]] = [
         ("enable", "proxyEnabled", {}),
-        ("proxy_type", "proxyType", {}),
+        ("proxy_type", "proxyType", {"decoder": ProxyType}),
         (
             "hostname",
             "proxyHostname",
-            {"decoder": lambda v: v or None, "encoder": lambda v: v or ""},
+            {"decoder": optional_str_decoder, "encoder": optional_str_encoder},
         ),
         ("port", "proxyPort", {}),
         (
             "username",
             "proxyUsername",
-            {"decoder": lambda v: v or None, "encoder": lambda v: v or ""},
+            {"decoder": optional_str_decoder, "encoder": optional_str_encoder},
         ),
         (
             "password",
             "proxyPassword",
-            {
-                "decoder": lambda v: v or None,
-                "encoder": lambda v: v.get_secret_value() if v else "",
-            },
+            {"decoder": optional_secret_decoder, "encoder": optional_secret_encoder},
         ),
         (
             "ignored_addresses",
             "proxyBypassFilter",
-            {
-                "decoder": lambda v: (
-                    set(addr.strip() for addr in v.split(",")) if v and v.strip() else []
-                ),
-                "encoder": lambda v: ",".join(sorted(v)) if v else "",
-            },
+            {"decoder": _decode_ignored_addresses, "encoder": _encode_ignored_addresses},
         ),
         ("bypass_proxy_for_local_addresses", "proxyBypassLocalAddresses", {}),
     ]
@@ -407,7 +468,9 @@ class LoggingGeneralSettings(GeneralSettings):
     * `TRACE` - Trace diagnostics log output
     """
 
-    _remote_map: ClassVar[List[RemoteMapEntry]] = [("log_level", "logLevel", {})]
+    _remote_map: ClassVar[List[RemoteMapEntry]] = [
+        ("log_level", "logLevel", {"decoder": LidarrLogLevel}),
+    ]
 
 
 class AnalyticsGeneralSettings(GeneralSettings):
@@ -480,11 +543,11 @@ class UpdatesGeneralSettings(GeneralSettings):
     _remote_map: ClassVar[List[RemoteMapEntry]] = [
         ("branch", "branch", {}),
         ("automatic", "updateAutomatically", {}),
-        ("mechanism", "updateMechanism", {}),
+        ("mechanism", "updateMechanism", {"decoder": UpdateMechanism}),
         (
             "script_path",
             "updateScriptPath",
-            {"decoder": lambda v: v or None, "encoder": lambda v: v or ""},
+            {"decoder": optional_str_decoder, "encoder": optional_str_encoder},
         ),
     ]
 
@@ -536,18 +599,26 @@ class LidarrGeneralSettingsConfig(LidarrConfigBase):
     updates: UpdatesGeneralSettings = UpdatesGeneralSettings()
     backup: BackupGeneralSettings = BackupGeneralSettings()
 
+    _sections: ClassVar[Dict[str, Type[GeneralSettings]]] = {
+        "host": HostGeneralSettings,
+        "security": SecurityGeneralSettings,
+        "proxy": ProxyGeneralSettings,
+        "logging": LoggingGeneralSettings,
+        "analytics": AnalyticsGeneralSettings,
+        "updates": UpdatesGeneralSettings,
+        "backup": BackupGeneralSettings,
+    }
+
     @classmethod
     def from_remote(cls, secrets: LidarrSecrets) -> Self:
         settings = api_get(secrets, "/api/v1/config/host")
-        return cls(
-            host=HostGeneralSettings._from_remote(settings),
-            security=SecurityGeneralSettings._from_remote(settings),
-            proxy=ProxyGeneralSettings._from_remote(settings),
-            logging=LoggingGeneralSettings._from_remote(settings),
-            analytics=AnalyticsGeneralSettings._from_remote(settings),
-            updates=UpdatesGeneralSettings._from_remote(settings),
-            backup=BackupGeneralSettings._from_remote(settings),
-        )
+        sections: Dict[str, Any] = {
+            section_name: section_type._from_remote(settings)
+            for section_name, section_type in cls._sections.items()
+        }
+        config = cls(**sections)
+        config._api_responses["/api/v1/config/host"] = settings
+        return config
 
     def update_remote(
         self,
@@ -556,60 +627,28 @@ class LidarrGeneralSettingsConfig(LidarrConfigBase):
         remote: Self,
         check_unmanaged: bool = False,
     ) -> bool:
-        host_updated, host_attrs = self.host._update_remote_attrs(
-            tree=f"{tree}.host",
-            secrets=secrets,
-            remote=remote.host,
-            check_unmanaged=check_unmanaged,
-        )
-        security_updated, security_attrs = self.security._update_remote_attrs(
-            tree=f"{tree}.security",
-            secrets=secrets,
-            remote=remote.security,
-            check_unmanaged=check_unmanaged,
-        )
-        proxy_updated, proxy_attrs = self.proxy._update_remote_attrs(
-            tree=f"{tree}.proxy",
-            secrets=secrets,
-            remote=remote.proxy,
-            check_unmanaged=check_unmanaged,
-        )
-        logging_updated, logging_attrs = self.logging._update_remote_attrs(
-            tree=f"{tree}.logging",
-            secrets=secrets,
-            remote=remote.logging,
-            check_unmanaged=check_unmanaged,
-        )
-        analytics_updated, analytics_attrs = self.analytics._update_remote_attrs(
-            tree=f"{tree}.analytics",
-            secrets=secrets,
-            remote=remote.analytics,
-            check_unmanaged=check_unmanaged,
-        )
-        updates_updated, updates_attrs = self.updates._update_remote_attrs(
-            tree=f"{tree}.updates",
-            secrets=secrets,
-            remote=remote.updates,
-            check_unmanaged=check_unmanaged,
-        )
-        backup_updated, backup_attrs = self.backup._update_remote_attrs(
-            tree=f"{tree}.backup",
-            secrets=secrets,
-            remote=remote.backup,
-            check_unmanaged=check_unmanaged,
-        )
-        if any(
-            [
-                host_updated,
-                security_updated,
-                proxy_updated,
-                logging_updated,
-                analytics_updated,
-                updates_updated,
-                backup_updated,
-            ],
+        # If every managed attribute already matches the remote instance, there is
+        # nothing to update, so skip comparing the attributes individually.
+        if not check_unmanaged and all(
+            getattr(self, section_name)._managed_attrs_up_to_date(getattr(remote, section_name))
+            for section_name in self._sections
         ):
-            remote_config = api_get(secrets, "/api/v1/config/host")
+            logger.debug("%s: (up to date)", tree)
+            return False
+        changed = False
+        remote_attrs: Dict[str, Any] = {}
+        for section_name in self._sections:
+            section_updated, section_attrs = getattr(self, section_name)._update_remote_attrs(
+                tree=f"{tree}.{section_name}",
+                secrets=secrets,
+                remote=getattr(remote, section_name),
+                check_unmanaged=check_unmanaged,
+            )
+            if section_updated:
+                changed = True
+            remote_attrs.update(section_attrs)
+        if changed:
+            remote_config = remote._api_get(secrets, "/api/v1/config/host")
             api_put(
                 secrets,
                 f"/api/v1/config/host/{remote_config['id']}",
@@ -617,13 +656,7 @@ class LidarrGeneralSettingsConfig(LidarrConfigBase):
                     # There are some undocumented values that are not
                     # set by Buildarr. Pass those through unmodified.
                     **remote_config,
-                    **host_attrs,
-                    **security_attrs,
-                    **proxy_attrs,
-                    **logging_attrs,
-                    **analytics_attrs,
-                    **updates_attrs,
-                    **backup_attrs,
+                    **remote_attrs,
                 },
             )
             return True
@@ -19,7 +19,7 @@ Lidarr plugin media management settings configuration.
 from __future__ import annotations
 
 from logging import getLogger
-from typing import Any, ClassVar, Dict, List, Optional, Set, cast
+from typing import Any, ClassVar, Dict, FrozenSet, Optional, Tuple
 
 from buildarr.config import RemoteMapEntry
 from buildarr.types import BaseEnum, NonEmptyStr
@@ -29,6 +29,7 @@ from typing_extensions import Annotated, Self
 from ..api import api_delete, api_get, api_post, api_put
 from ..secrets import LidarrSecrets
 from .types import LidarrConfigBase
+from .util import optional_str_decoder, optional_str_encoder
 
 logger = getLogger(__name__)
 
@@ -92,12 +93,25 @@ class ChmodFolder(BaseEnum):
         Ensure that octal and decimal integers are both read properly by Buildarr.
         """
         try:
-            return cls(oct(v)[2:] if isinstance(v, int) else v)
-        except ValueError:
-            try:
-                return cls[v.replace("-", "_")]
-            except (TypeError, KeyError):
-                raise ValueError(f"Invalid {cls.__name__} name or value: {v}") from None
+            return _CHMOD_FOLDER_LOOKUP[v]
+        except (TypeError, KeyError):
+            raise ValueError(f"Invalid {cls.__name__} name or value: {v}") from None
+
+
+# All accepted representations of each `ChmodFolder` permission, e.g. for `drwxr-xr-x`:
+# the object itself, `"755"`, `0o755`, `755`, `"drwxr_xr_x"` and `"drwxr-xr-x"`.
+_CHMOD_FOLDER_LOOKUP: Dict[Any, ChmodFolder] = {
+    key: chmod_folder
+    for chmod_folder in ChmodFolder
+    for key in (
+        chmod_folder,
+        chmod_folder.value,
+        int(chmod_folder.value, 8),
+        int(chmod_folder.value),
+        chmod_folder.name,
+        chmod_folder.name.replace("_", "-"),
+    )
+}
 
 
 class LidarrMediaManagementSettingsConfig(LidarrConfigBase):
@@ -313,7 +327,7 @@ class LidarrMediaManagementSettingsConfig(LidarrConfigBase):
     It's better to ensure the download client uses the same group as Lidarr.
     """
 
-    root_folders: Set[NonEmptyStr] = set()
+    root_folders: FrozenSet[NonEmptyStr] = frozenset()
     """
     This allows you to create a root path for a place to either
     place new imported downloads, or to allow Lidarr to scan existing media.
@@ -340,11 +354,15 @@ class LidarrMediaManagementSettingsConfig(LidarrConfigBase):
     *New in version 0.1.2.*
     """
 
-    _naming_remote_map: ClassVar[List[RemoteMapEntry]] = [
+    _naming_remote_map: ClassVar[Tuple[RemoteMapEntry, ...]] = (
         # Episode Naming
         ("rename_tracks", "renameTracks", {}),
         ("replace_illegal_characters", "replaceIllegalCharacters", {}),
-        ("colon_replacement_format", "colonReplacementFormat", {}),
+        (
+            "colon_replacement_format",
+            "colonReplacementFormat",
+            {"decoder": ColonReplacementFormat},
+        ),
         ("standard_track_format", "standardTrackFormat", {}),
         ("multi_disk_track_format", "multiDiscTrackFormat", {}),
         ("artist_folder_format", "artistFolderFormat", {}),
@@ -352,8 +370,8 @@ class LidarrMediaManagementSettingsConfig(LidarrConfigBase):
         ("include_album_title", "includeAlbumTitle", {}),
         ("include_quality", "includeQuality", {}),
         ("replace_spaces", "replaceSpaces", {}),
-    ]
-    _mediamanagement_remote_map: ClassVar[List[RemoteMapEntry]] = [
+    )
+    _mediamanagement_remote_map: ClassVar[Tuple[RemoteMapEntry, ...]] = (
         # Folders
         ("delete_empty_folders", "deleteEmptyFolders", {}),
         # Importing
@@ -362,43 +380,52 @@ class LidarrMediaManagementSettingsConfig(LidarrConfigBase):
         ("use_hardlinks", "copyUsingHardlinks", {}),
         ("import_extra_files", "importExtraFiles", {}),
         # File Management
-        ("propers_and_repacks", "downloadPropersAndRepacks", {}),
-        ("rescan_artist_folder_after_refresh", "rescanAfterRefresh", {}),
-        ("change_file_date", "fileDate", {}),
+        ("propers_and_repacks", "downloadPropersAndRepacks", {"decoder": PropersAndRepacks}),
+        (
+            "rescan_artist_folder_after_refresh",
+            "rescanAfterRefresh",
+            {"decoder": RescanArtistFolderAfterRefresh},
+        ),
+        ("change_file_date", "fileDate", {"decoder": ChangeFileDate}),
         (
             "recycling_bin",
             "recycleBin",
-            {"decoder": lambda v: v or None, "encoder": lambda v: v or ""},
+            {"decoder": optional_str_decoder, "encoder": optional_str_encoder},
         ),
         ("recycling_bin_cleanup", "recycleBinCleanupDays", {}),
         # Permissions
         ("set_permissions", "setPermissionsLinux", {}),
-        ("chmod_folder", "chmodFolder", {}),
+        ("chmod_folder", "chmodFolder", {"decoder": ChmodFolder}),
         (
             "chown_group",
             "chownGroup",
-            {"decoder": lambda v: v or None, "encoder": lambda v: v or ""},
+            {"decoder": optional_str_decoder, "encoder": optional_str_encoder},
         ),
-    ]
+    )
 
     @classmethod
     def from_remote(cls, secrets: LidarrSecrets) -> Self:
-        return cls(
+        naming_config = api_get(secrets, "/api/v1/config/naming")
+        mediamanagement_config = api_get(secrets, "/api/v1/config/mediamanagement")
+        api_root_folders = api_get(secrets, "/api/v1/rootfolder")
+        # Remote values are decoded to their local types by the remote maps,
+        # so validation is skipped when constructing the remote configuration.
+        config = cls.model_construct(
             # Episode Naming
-            **cls.get_local_attrs(
-                cls._naming_remote_map,
-                api_get(secrets, "/api/v1/config/naming"),
-            ),
+            **cls.get_local_attrs(cls._naming_remote_map, naming_config),
             # All other sections except Root Folders
-            **cls.get_local_attrs(
-                cls._mediamanagement_remote_map,
-                api_get(secrets, "/api/v1/config/mediamanagement"),
-            ),
+            **cls.get_local_attrs(cls._mediamanagement_remote_map, mediamanagement_config),
             # Root Folders
-            root_folders=set(
-                cast(NonEmptyStr, rf["path"]) for rf in api_get(secrets, "/api/v1/rootfolder")
-            ),
+            root_folders=frozenset(rf["path"] for rf in api_root_folders),
         )
+        config._api_responses.update(
+            {
+                "/api/v1/config/naming": naming_config,
+                "/api/v1/config/mediamanagement": mediamanagement_config,
+                "/api/v1/rootfolder": api_root_folders,
+            },
+        )
+        return config
 
     def update_remote(
         self,
@@ -407,8 +434,10 @@ class LidarrMediaManagementSettingsConfig(LidarrConfigBase):
         remote: Self,
         check_unmanaged: bool = False,
     ) -> bool:
+        # The naming, media management and root folder settings are separate
+        # API resources, so all of them are updated before the results are combined.
         return any(
-            [
+            (
                 # Episode Naming
                 self._update_remote_naming(
                     tree=tree,
@@ -430,7 +459,7 @@ class LidarrMediaManagementSettingsConfig(LidarrConfigBase):
                     remote=remote,
                     check_unmanaged=check_unmanaged,
                 ),
-            ],
+            ),
         )
 
     def _update_remote_naming(
@@ -448,7 +477,7 @@ class LidarrMediaManagementSettingsConfig(LidarrConfigBase):
             set_unchanged=True,
         )
         if updated:
-            config_id = api_get(secrets, "/api/v1/config/naming")["id"]
+            config_id = remote._api_get(secrets, "/api/v1/config/naming")["id"]
             api_put(
                 secrets,
                 f"/api/v1/config/naming/{config_id}",
@@ -472,7 +501,7 @@ class LidarrMediaManagementSettingsConfig(LidarrConfigBase):
             set_unchanged=True,
         )
         if updated:
-            config_id = api_get(secrets, "/api/v1/config/mediamanagement")["id"]
+            config_id = remote._api_get(secrets, "/api/v1/config/mediamanagement")["id"]
             api_put(
                 secrets,
                 f"/api/v1/config/mediamanagement/{config_id}",
@@ -488,11 +517,11 @@ class LidarrMediaManagementSettingsConfig(LidarrConfigBase):
         remote: Self,
         check_unmanaged: bool = False,
     ) -> bool:
+        if not self.root_folders:
+            return False
         changed = False
-        current_root_folders: Dict[str, int] = {
-            rf["path"]: rf["id"] for rf in api_get(secrets, "/api/v1/rootfolder")
-        }
-        for i, root_folder in enumerate(self.root_folders):
+        current_root_folders = {rf["path"] for rf in remote._api_get(secrets, "/api/v1/rootfolder")}
+        for i, root_folder in enumerate(sorted(self.root_folders)):
             if root_folder in current_root_folders:
                 logger.debug("%s[%i]: %s (exists)", tree, i, repr(str(root_folder)))
             else:
@@ -519,13 +548,12 @@ class LidarrMediaManagementSettingsConfig(LidarrConfigBase):
 
     def _delete_remote_rootfolder(self, tree: str, secrets: LidarrSecrets, remote: Self) -> bool:
         changed = False
-        current_root_folders: Dict[str, int] = {
-            rf["path"]: rf["id"] for rf in api_get(secrets, "/api/v1/rootfolder")
+        current_root_folders = {
+            rf["path"]: rf["id"] for rf in remote._api_get(secrets, "/api/v1/rootfolder")
         }
-        expected_root_folders = set(self.root_folders)
         i = -1
         for root_folder, root_folder_id in current_root_folders.items():
-            if root_folder not in expected_root_folders:
+            if root_folder not in self.root_folders:
                 if self.delete_unmanaged_root_folders:
                     logger.info("%s[%i]: %s -> (deleted)", tree, i, repr(str(root_folder)))
                     api_delete(secrets, f"/api/v1/rootfolder/{root_folder_id}")
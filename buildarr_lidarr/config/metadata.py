@@ -18,7 +18,7 @@ Lidarr plugin metadata settings configuration.
 
 from __future__ import annotations
 
-from typing import Any, ClassVar, Dict, List, Mapping, Optional, Tuple, Type
+from typing import Any, ClassVar, Dict, List, Mapping, Tuple, Type
 
 from buildarr.config import RemoteMapEntry
 from typing_extensions import Self
@@ -38,13 +38,21 @@ class Metadata(LidarrConfigBase):
     When set to `True`, enables creating metadata files in the given format.
     """
 
+    _name: ClassVar[str]
     _implementation: ClassVar[str]
-    _base_remote_map: ClassVar[List[RemoteMapEntry]] = [("enable", "enable", {})]
-    _remote_map: ClassVar[List[RemoteMapEntry]]
+    _base_remote_map: ClassVar[Tuple[RemoteMapEntry, ...]] = (("enable", "enable", {}),)
+    _remote_map: ClassVar[Tuple[RemoteMapEntry, ...]] = ()
+    # Base and implementation-specific remote map entries, combined once per subclass.
+    _combined_remote_map: ClassVar[Tuple[RemoteMapEntry, ...]] = _base_remote_map
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._combined_remote_map = cls._base_remote_map + cls._remote_map
 
     @classmethod
     def _from_remote(cls, metadata: Dict[str, Any]) -> Self:
-        return cls(**cls.get_local_attrs(cls._base_remote_map + cls._remote_map, metadata))
+        return cls(**cls.get_local_attrs(cls._combined_remote_map, metadata))
 
     def _update_remote(
         self,
@@ -57,28 +65,28 @@ class Metadata(LidarrConfigBase):
         updated, remote_attrs = self.get_update_remote_attrs(
             tree,
             remote,
-            self._base_remote_map + self._remote_map,
+            self._combined_remote_map,
             check_unmanaged=check_unmanaged,
             set_unchanged=True,
         )
         if updated:
-            updated_fields = {f["name"]: f["value"] for f in remote_attrs.pop("fields")}
-            fields = [
-                (
-                    {**field, "value": updated_fields[field["name"]]}
-                    if field["name"] in updated_fields
-                    else field
-                )
-                for field in api_metadata["fields"]
-            ]
+            # Only rebuild the field list if any fields are managed by this metadata type.
+            # The API metadata object is not modified, as it may be reused.
+            remote_fields = remote_attrs.pop("fields", None)
+            if remote_fields:
+                updated_fields = {f["name"]: f["value"] for f in remote_fields}
+                remote_attrs["fields"] = [
+                    (
+                        {**field, "value": updated_fields[field["name"]]}
+                        if field["name"] in updated_fields
+                        else field
+                    )
+                    for field in api_metadata["fields"]
+                ]
             api_put(
                 secrets,
                 f"/api/v1/metadata/{api_metadata['id']}",
-                {
-                    **api_metadata,
-                    **remote_attrs,
-                    "fields": fields,
-                },
+                {**api_metadata, **remote_attrs},
             )
             return True
         return False
@@ -97,8 +105,9 @@ class KodiEmbyMetadata(Metadata):
     ```
     """
 
+    _name: ClassVar[str] = "Kodi (XBMC)/Emby"
     _implementation: ClassVar[str] = "XbmcMetadata"
-    _remote_map: ClassVar[List[RemoteMapEntry]] = []
+    _remote_map: ClassVar[Tuple[RemoteMapEntry, ...]] = ()
 
 
 class RoksboxMetadata(Metadata):
@@ -114,8 +123,9 @@ class RoksboxMetadata(Metadata):
     ```
     """
 
+    _name: ClassVar[str] = "Roksbox"
     _implementation: ClassVar[str] = "RoksboxMetadata"
-    _remote_map: ClassVar[List[RemoteMapEntry]] = []
+    _remote_map: ClassVar[Tuple[RemoteMapEntry, ...]] = ()
 
 
 class WdtvMetadata(Metadata):
@@ -131,8 +141,9 @@ class WdtvMetadata(Metadata):
     ```
     """
 
+    _name: ClassVar[str] = "WDTV"
     _implementation: ClassVar[str] = "WdtvMetadata"
-    _remote_map: ClassVar[List[RemoteMapEntry]] = []
+    _remote_map: ClassVar[Tuple[RemoteMapEntry, ...]] = ()
 
 
 METADATA_TYPES: Tuple[Type[Metadata], ...] = (KodiEmbyMetadata, RoksboxMetadata, WdtvMetadata)
@@ -153,33 +164,15 @@ class LidarrMetadataSettingsConfig(LidarrConfigBase):
 
     @classmethod
     def from_remote(cls, secrets: LidarrSecrets) -> Self:
-        kodi_emby_metadata: Optional[Dict[str, Any]] = None
-        roksbox_metadata: Optional[Dict[str, Any]] = None
-        wdtv_metadata: Optional[Dict[str, Any]] = None
-        for metadata in api_get(secrets, "/api/v1/metadata"):
-            if metadata["implementation"] == KodiEmbyMetadata._implementation:
-                kodi_emby_metadata = metadata
-            elif metadata["implementation"] == RoksboxMetadata._implementation:
-                roksbox_metadata = metadata
-            elif metadata["implementation"] == WdtvMetadata._implementation:
-                wdtv_metadata = metadata
-        if kodi_emby_metadata is None:
-            raise RuntimeError(
-                "Unable to find Kodi (XBMC)/Emby metadata on Lidarr, database might be corrupt",
-            )
-        if roksbox_metadata is None:
-            raise RuntimeError(
-                "Unable to find Roksbox metadata on Lidarr, database might be corrupt",
-            )
-        if wdtv_metadata is None:
-            raise RuntimeError(
-                "Unable to find WDTV metadata on Lidarr, database might be corrupt",
-            )
-        return cls(
-            kodi_emby=KodiEmbyMetadata._from_remote(kodi_emby_metadata),
-            roksbox=RoksboxMetadata._from_remote(roksbox_metadata),
-            wdtv=WdtvMetadata._from_remote(wdtv_metadata),
+        api_metadata = api_get(secrets, "/api/v1/metadata")
+        found_metadata = cls._get_api_metadata(api_metadata)
+        config = cls(
+            kodi_emby=KodiEmbyMetadata._from_remote(found_metadata[KodiEmbyMetadata]),
+            roksbox=RoksboxMetadata._from_remote(found_metadata[RoksboxMetadata]),
+            wdtv=WdtvMetadata._from_remote(found_metadata[WdtvMetadata]),
         )
+        config._api_responses["/api/v1/metadata"] = api_metadata
+        return config
 
     def update_remote(
         self,
@@ -188,50 +181,53 @@ class LidarrMetadataSettingsConfig(LidarrConfigBase):
         remote: Self,
         check_unmanaged: bool = False,
     ) -> bool:
-        kodi_emby_metadata: Optional[Dict[str, Any]] = None
-        roksbox_metadata: Optional[Dict[str, Any]] = None
-        wdtv_metadata: Optional[Dict[str, Any]] = None
-        for metadata in api_get(secrets, "/api/v1/metadata"):
-            if metadata["implementation"] == KodiEmbyMetadata._implementation:
-                kodi_emby_metadata = metadata
-            elif metadata["implementation"] == RoksboxMetadata._implementation:
-                roksbox_metadata = metadata
-            elif metadata["implementation"] == WdtvMetadata._implementation:
-                wdtv_metadata = metadata
-        if kodi_emby_metadata is None:
-            raise RuntimeError(
-                "Unable to find Kodi (XBMC)/Emby metadata on Lidarr, database might be corrupt",
-            )
-        if roksbox_metadata is None:
-            raise RuntimeError(
-                "Unable to find Roksbox metadata on Lidarr, database might be corrupt",
-            )
-        if wdtv_metadata is None:
-            raise RuntimeError(
-                "Unable to find WDTV metadata on Lidarr, database might be corrupt",
-            )
+        found_metadata = self._get_api_metadata(remote._api_get(secrets, "/api/v1/metadata"))
+        # Build the tuple of results first, so that every metadata type is updated
+        # on the remote instance, even after an earlier one reports a change.
         return any(
-            [
+            (
                 self.kodi_emby._update_remote(
                     tree=f"{tree}.kodi_emby",
                     secrets=secrets,
                     remote=remote.kodi_emby,
-                    api_metadata=kodi_emby_metadata,
+                    api_metadata=found_metadata[KodiEmbyMetadata],
                     check_unmanaged=check_unmanaged,
                 ),
                 self.roksbox._update_remote(
                     tree=f"{tree}.roksbox",
                     secrets=secrets,
                     remote=remote.roksbox,
-                    api_metadata=roksbox_metadata,
+                    api_metadata=found_metadata[RoksboxMetadata],
                     check_unmanaged=check_unmanaged,
                 ),
                 self.wdtv._update_remote(
                     tree=f"{tree}.wdtv",
                     secrets=secrets,
                     remote=remote.wdtv,
-                    api_metadata=wdtv_metadata,
+                    api_metadata=found_metadata[WdtvMetadata],
                     check_unmanaged=check_unmanaged,
                 ),
-            ],
+            ),
         )
+
+    @classmethod
+    def _get_api_metadata(
+        cls,
+        api_metadata: List[Dict[str, Any]],
+    ) -> Dict[Type[Metadata], Dict[str, Any]]:
+        found_metadata: Dict[Type[Metadata], Dict[str, Any]] = {}
+        for metadata in api_metadata:
+            metadata_type = METADATA_TYPE_MAP.get(metadata["implementation"])
+            if metadata_type is not None:
+                found_metadata[metadata_type] = metadata
+        missing_metadata = [
+            metadata_type._name
+            for metadata_type in METADATA_TYPES
+            if metadata_type not in found_metadata
+        ]
+        if missing_metadata:
+            raise RuntimeError(
+                f"Unable to find metadata on Lidarr: {', '.join(missing_metadata)} "
+                "(database might be corrupt)",
+            )
+        return found_metadata
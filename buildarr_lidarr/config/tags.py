@@ -19,7 +19,7 @@ Lidarr plugin tags settings configuration.
 from __future__ import annotations
 
 from logging import getLogger
-from typing import Dict, Set
+from typing import FrozenSet
 
 from buildarr.types import NonEmptyStr
 from typing_extensions import Self
@@ -48,7 +48,7 @@ class LidarrTagsSettingsConfig(LidarrConfigBase):
     in this configuration section.
     """
 
-    definitions: Set[NonEmptyStr] = set()
+    definitions: FrozenSet[NonEmptyStr] = frozenset()
     """
     Define tags that are used within Buildarr here.
 
@@ -58,9 +58,10 @@ class LidarrTagsSettingsConfig(LidarrConfigBase):
 
     @classmethod
     def from_remote(cls, secrets: LidarrSecrets) -> Self:
-        return cls(
-            definitions=set(tag["label"] for tag in api_get(secrets, "/api/v1/tag")),
-        )
+        api_tags = api_get(secrets, "/api/v1/tag")
+        config = cls.model_construct(definitions=frozenset(tag["label"] for tag in api_tags))
+        config._api_responses["/api/v1/tag"] = api_tags
+        return config
 
     def update_remote(
         self,
@@ -70,16 +71,13 @@ class LidarrTagsSettingsConfig(LidarrConfigBase):
         check_unmanaged: bool = False,
     ) -> bool:
         # This only does creations and updates, as Lidarr automatically cleans up unused tags.
-        changed = False
-        current_tags: Dict[str, int] = {
-            tag["label"]: tag["id"] for tag in api_get(secrets, "/api/v1/tag")
+        to_create = self.definitions - {
+            tag["label"] for tag in remote._api_get(secrets, "/api/v1/tag")
         }
-        if self.definitions:
-            for i, tag in enumerate(sorted(self.definitions)):
-                if tag in current_tags:
-                    logger.debug("%s.definitions[%i]: %s (exists)", tree, i, repr(tag))
-                else:
-                    logger.info("%s.definitions[%i]: %s -> (created)", tree, i, repr(tag))
-                    api_post(secrets, "/api/v1/tag", {"label": tag})
-                    changed = True
-        return changed
+        for i, tag in enumerate(sorted(self.definitions)):
+            if tag in to_create:
+                logger.info("%s.definitions[%i]: %s -> (created)", tree, i, repr(tag))
+                api_post(secrets, "/api/v1/tag", {"label": tag})
+            else:
+                logger.debug("%s.definitions[%i]: %s (exists)", tree, i, repr(tag))
+        return bool(to_create)
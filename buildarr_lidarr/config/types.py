@@ -18,13 +18,36 @@ Lidarr plugin configuration utility classes and functions.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Dict
 
 from buildarr.config import ConfigBase
+from pydantic import PrivateAttr
+
+from ..api import api_get
 
 if TYPE_CHECKING:
-    from ..secrets import LidarrSecrets  # noqa: F401
+    from ..secrets import LidarrSecrets
 
 
 class LidarrConfigBase(ConfigBase["LidarrSecrets"]):
-    pass
+    # Lidarr API responses received while creating this object using `from_remote`,
+    # keyed by API URL, so they can be reused when updating the remote instance.
+    _api_responses: Dict[str, Any] = PrivateAttr(default_factory=dict)
+
+    def _api_get(self, secrets: LidarrSecrets, api_url: str) -> Any:
+        """
+        Send an API `GET` request, unless a response for the API URL
+        is already stored on this object, in which case it is returned instead.
+
+        Args:
+            secrets (LidarrSecrets): Lidarr secrets metadata.
+            api_url (str): Lidarr API command.
+
+        Returns:
+            Response object
+        """
+
+        try:
+            return self._api_responses[api_url]
+        except KeyError:
+            return api_get(secrets, api_url)
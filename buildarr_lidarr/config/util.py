@@ -19,6 +19,9 @@ Lidarr plugin configuration utility classes and functions.
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from typing import Optional
+
+from pydantic import SecretStr
 
 
 def trakt_expires_encoder(dt: datetime) -> str:
@@ -46,3 +49,69 @@ def trakt_expires_encoder(dt: datetime) -> str:
         dt_aware = dt.replace(tzinfo=timezone.utc)
 
     return dt_aware.isoformat().replace("+00:00", "Z")
+
+
+def optional_str_decoder(value: Optional[str]) -> Optional[str]:
+    """
+    Optional string API value decoder.
+
+    Lidarr represents unset string values as empty strings,
+    which are decoded to `None`.
+
+    Args:
+        value (Optional[str]): Value to decode
+
+    Returns:
+        Decoded string, or `None` if empty
+    """
+
+    return value or None
+
+
+def optional_str_encoder(value: Optional[str]) -> str:
+    """
+    Optional string API value encoder.
+
+    Unset (`None`) values are encoded to empty strings, as expected by Lidarr.
+
+    Args:
+        value (Optional[str]): Value to encode
+
+    Returns:
+        Encoded string, which is empty if the value is unset
+    """
+
+    return value or ""
+
+
+def optional_secret_decoder(value: Optional[str]) -> Optional[SecretStr]:
+    """
+    Optional secret string API value decoder.
+
+    Lidarr represents unset secret values as empty strings,
+    which are decoded to `None`.
+
+    Args:
+        value (Optional[str]): Value to decode
+
+    Returns:
+        Decoded secret string, or `None` if empty
+    """
+
+    return SecretStr(value) if value else None
+
+
+def optional_secret_encoder(value: Optional[SecretStr]) -> str:
+    """
+    Optional secret string API value encoder.
+
+    Unset (`None`) values are encoded to empty strings, as expected by Lidarr.
+
+    Args:
+        value (Optional[SecretStr]): Value to encode
+
+    Returns:
+        Encoded secret value, which is empty if the value is unset
+    """
+
+    return value.get_secret_value() if value else ""
@@ -27,11 +27,12 @@ from urllib.parse import urlparse
 
 import pytest
 
-from buildarr_sonarr.secrets import SonarrSecrets
+from buildarr_lidarr.secrets import LidarrSecrets
 
 if TYPE_CHECKING:
     from typing import Callable, Optional
 
+    from buildarr_sonarr.secrets import SonarrSecrets
     from pytest_httpserver import HTTPServer
 
 
@@ -41,6 +42,12 @@ class SonarrAPI:
     secrets: SonarrSecrets
 
 
+@dataclass(frozen=True)
+class LidarrAPI:
+    server: HTTPServer
+    secrets: LidarrSecrets
+
+
 @pytest.fixture
 def api_key() -> str:
     """
@@ -66,6 +73,8 @@ def sonarr_api_factory(httpserver: HTTPServer, api_key) -> Callable[..., SonarrA
     """
 
     def _sonarr_api_factory(url_base: Optional[str] = None, version: str = "3.0.10.1567"):
+        from buildarr_sonarr.secrets import SonarrSecrets
+
         return SonarrAPI(
             server=httpserver,
             secrets=SonarrSecrets(
@@ -93,3 +102,43 @@ def sonarr_api(sonarr_api_factory) -> SonarrAPI:
     """
 
     return sonarr_api_factory()
+
+
+@pytest.fixture
+def lidarr_api_factory(httpserver: HTTPServer, api_key) -> Callable[..., LidarrAPI]:
+    """
+    A factory fixture for starting up a stub Lidarr API for tests,
+    where the expected inputs and outputs can be defined and validated.
+
+    Returns:
+        Callable[..., LidarrAPI]: The factory function.
+    """
+
+    def _lidarr_api_factory(url_base: Optional[str] = None, version: str = "2.5.3.4341"):
+        return LidarrAPI(
+            server=httpserver,
+            secrets=LidarrSecrets(
+                hostname="localhost",  # type: ignore[arg-type]
+                port=urlparse(httpserver.url_for("")).port,
+                protocol="http",
+                url_base=url_base,
+                api_key=api_key,
+                version=version,  # type: ignore[arg-type]
+            ),
+        )
+
+    return _lidarr_api_factory
+
+
+@pytest.fixture
+def lidarr_api(lidarr_api_factory) -> LidarrAPI:
+    """
+    Fixture for creating a stub Lidarr API with the default options set.
+
+    For more information, refer to the docstring for `lidarr_api_factory`.
+
+    Returns:
+        LidarrAPI: The Lidarr API object.
+    """
+
+    return lidarr_api_factory()
@@ -0,0 +1,105 @@
+# Copyright (C) 2024 Callum Dickinson
+#
+# Buildarr is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# Buildarr is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with Buildarr.
+# If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Test the `from_remote` class method on the Lidarr General Settings configuration model.
+"""
+
+from __future__ import annotations
+
+from ipaddress import IPv4Address
+
+import pytest
+
+from pydantic import SecretStr
+
+from buildarr_lidarr.config.general import (
+    AuthenticationMethod,
+    AuthenticationRequired,
+    CertificateValidation,
+    LidarrGeneralSettingsConfig as GeneralSettings,
+    LidarrLogLevel,
+    ProxyType,
+    UpdateMechanism,
+)
+
+from .util import LIDARR_HOST_CONFIG_DEFAULTS
+
+API_HOST_CONFIG = {
+    **LIDARR_HOST_CONFIG_DEFAULTS,
+    "bindAddress": "127.0.0.1",
+    "authenticationMethod": "basic",
+    "authenticationRequired": "disabledForLocalAddresses",
+    "username": "admin",
+    "password": "secret",
+    "certificateValidation": "disabled",
+    "proxyEnabled": True,
+    "proxyType": "socks5",
+    "proxyHostname": "proxy.example.com",
+    "proxyUsername": "proxy",
+    "proxyPassword": "proxy-secret",
+    "proxyBypassFilter": "example.com,example.org",
+    "logLevel": "debug",
+    "updateMechanism": "script",
+    "updateScriptPath": "/config/update.sh",
+}
+
+
+def test_types(lidarr_api) -> None:
+    """
+    Check that attributes are decoded from their API values into their local types.
+    """
+
+    lidarr_api.server.expect_ordered_request(
+        "/api/v1/config/host",
+        method="GET",
+    ).respond_with_json(API_HOST_CONFIG)
+
+    remote = GeneralSettings.from_remote(lidarr_api.secrets)
+
+    assert remote.host.bind_address == IPv4Address("127.0.0.1")
+    assert remote.security.authentication is AuthenticationMethod.basic
+    assert remote.security.authentication_required is AuthenticationRequired.local_disabled
+    assert isinstance(remote.security.password, SecretStr)
+    assert remote.security.password.get_secret_value() == "secret"
+    assert remote.security.certificate_validation is CertificateValidation.disabled
+    assert remote.proxy.proxy_type is ProxyType.socks5
+    assert isinstance(remote.proxy.password, SecretStr)
+    assert remote.proxy.password.get_secret_value() == "proxy-secret"
+    assert remote.proxy.ignored_addresses == {"example.com", "example.org"}
+    assert remote.logging.log_level is LidarrLogLevel.DEBUG
+    assert remote.updates.mechanism is UpdateMechanism.script
+
+
+@pytest.mark.parametrize("check_unmanaged", [False, True])
+def test_round_trip(lidarr_api, check_unmanaged) -> None:
+    """
+    Check that a configuration created from the values read from the remote instance
+    is up to date with it, and does not result in an update request.
+    """
+
+    lidarr_api.server.expect_ordered_request(
+        "/api/v1/config/host",
+        method="GET",
+    ).respond_with_json(API_HOST_CONFIG)
+
+    remote = GeneralSettings.from_remote(lidarr_api.secrets)
+
+    assert not GeneralSettings(**remote.model_dump()).update_remote(
+        tree="lidarr.settings.general",
+        secrets=lidarr_api.secrets,
+        remote=remote,
+        check_unmanaged=check_unmanaged,
+    )
+    lidarr_api.server.check_assertions()
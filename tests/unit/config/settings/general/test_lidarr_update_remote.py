@@ -0,0 +1,153 @@
+# Copyright (C) 2024 Callum Dickinson
+#
+# Buildarr is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# Buildarr is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with Buildarr.
+# If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Test the `update_remote` method on the Lidarr General Settings configuration model.
+"""
+
+from __future__ import annotations
+
+from buildarr_lidarr.config.general import (
+    HostGeneralSettings,
+    LidarrGeneralSettingsConfig as GeneralSettings,
+)
+
+from .util import LIDARR_HOST_CONFIG_DEFAULTS
+
+
+def test_security_password_confirmation_unset(lidarr_api) -> None:
+    """
+    Check that when no password is defined, the general settings can be updated,
+    and the password confirmation is sent to the remote instance as an empty string.
+    """
+
+    api_host_config = {
+        **LIDARR_HOST_CONFIG_DEFAULTS,
+        "instanceName": "Buildarr",
+        "passwordConfirmation": "",
+    }
+
+    lidarr_api.server.expect_ordered_request(
+        "/api/v1/config/host",
+        method="GET",
+    ).respond_with_json(LIDARR_HOST_CONFIG_DEFAULTS)
+    lidarr_api.server.expect_ordered_request(
+        "/api/v1/config/host/1",
+        method="PUT",
+        json=api_host_config,
+    ).respond_with_json(api_host_config, status=202)
+
+    assert GeneralSettings(host={"instance_name": "Buildarr"}).update_remote(  # type: ignore[arg-type]
+        tree="lidarr.settings.general",
+        secrets=lidarr_api.secrets,
+        remote=GeneralSettings.from_remote(lidarr_api.secrets),
+    )
+    lidarr_api.server.check_assertions()
+
+
+def test_up_to_date(lidarr_api) -> None:
+    """
+    Check that when every managed attribute matches the remote instance,
+    no update request is made.
+    """
+
+    lidarr_api.server.expect_ordered_request(
+        "/api/v1/config/host",
+        method="GET",
+    ).respond_with_json(LIDARR_HOST_CONFIG_DEFAULTS)
+
+    assert not GeneralSettings(
+        host={"port": 8686, "instance_name": "Lidarr"},  # type: ignore[arg-type]
+        backup={"interval": 7},  # type: ignore[arg-type]
+    ).update_remote(
+        tree="lidarr.settings.general",
+        secrets=lidarr_api.secrets,
+        remote=GeneralSettings.from_remote(lidarr_api.secrets),
+    )
+    lidarr_api.server.check_assertions()
+
+
+def test_one_section_changed(lidarr_api) -> None:
+    """
+    Check that when only one section differs from the remote instance,
+    the general settings are still updated.
+    """
+
+    api_host_config = {
+        **LIDARR_HOST_CONFIG_DEFAULTS,
+        "backupRetention": 14,
+        "passwordConfirmation": "",
+    }
+
+    lidarr_api.server.expect_ordered_request(
+        "/api/v1/config/host",
+        method="GET",
+    ).respond_with_json(LIDARR_HOST_CONFIG_DEFAULTS)
+    lidarr_api.server.expect_ordered_request(
+        "/api/v1/config/host/1",
+        method="PUT",
+        json=api_host_config,
+    ).respond_with_json(api_host_config, status=202)
+
+    assert GeneralSettings(
+        host={"port": 8686, "instance_name": "Lidarr"},  # type: ignore[arg-type]
+        backup={"retention": 14},  # type: ignore[arg-type]
+    ).update_remote(
+        tree="lidarr.settings.general",
+        secrets=lidarr_api.secrets,
+        remote=GeneralSettings.from_remote(lidarr_api.secrets),
+    )
+    lidarr_api.server.check_assertions()
+
+
+def test_equals_override(lidarr_api, monkeypatch) -> None:
+    """
+    Check that sections with remote map entries overriding `equals`
+    are compared using the override, instead of the up to date check.
+    """
+
+    monkeypatch.setattr(
+        HostGeneralSettings,
+        "_remote_map",
+        [
+            (
+                local_attr,
+                remote_attr,
+                (
+                    {**attr_metadata, "equals": lambda a, b: False}
+                    if local_attr == "instance_name"
+                    else attr_metadata
+                ),
+            )
+            for local_attr, remote_attr, attr_metadata in HostGeneralSettings._remote_map
+        ],
+    )
+    api_host_config = {**LIDARR_HOST_CONFIG_DEFAULTS, "passwordConfirmation": ""}
+
+    lidarr_api.server.expect_ordered_request(
+        "/api/v1/config/host",
+        method="GET",
+    ).respond_with_json(LIDARR_HOST_CONFIG_DEFAULTS)
+    lidarr_api.server.expect_ordered_request(
+        "/api/v1/config/host/1",
+        method="PUT",
+        json=api_host_config,
+    ).respond_with_json(api_host_config, status=202)
+
+    assert GeneralSettings(host={"instance_name": "Lidarr"}).update_remote(  # type: ignore[arg-type]
+        tree="lidarr.settings.general",
+        secrets=lidarr_api.secrets,
+        remote=GeneralSettings.from_remote(lidarr_api.secrets),
+    )
+    lidarr_api.server.check_assertions()
@@ -58,3 +58,42 @@ HOST_CONFIG_DEFAULTS = {
     "backupInterval": 7,  # days
     "backupRetention": 28,  # days
 }
+
+LIDARR_HOST_CONFIG_DEFAULTS = {
+    "id": 1,
+    # Host
+    "bindAddress": "*",
+    "port": 8686,
+    "sslPort": 6868,
+    "enableSsl": False,
+    "urlBase": "",
+    "instanceName": "Lidarr",
+    # Security
+    "authenticationMethod": "forms",
+    "authenticationRequired": "enabled",
+    "username": "",
+    "password": "",
+    "certificateValidation": "enabled",
+    # Proxy
+    "proxyEnabled": False,
+    "proxyType": "http",
+    "proxyHostname": "",
+    "proxyPort": 8080,
+    "proxyUsername": "",
+    "proxyPassword": "",
+    "proxyBypassFilter": "",
+    "proxyBypassLocalAddresses": True,
+    # Logging
+    "logLevel": "info",
+    # Analytics
+    "analyticsEnabled": True,
+    # Updates
+    "branch": "master",
+    "updateAutomatically": False,
+    "updateMechanism": "docker",
+    "updateScriptPath": "",
+    # Backup
+    "backupFolder": "Backups",
+    "backupInterval": 7,  # days
+    "backupRetention": 28,  # days
+}
@@ -0,0 +1,113 @@
+# Copyright (C) 2024 Callum Dickinson
+#
+# Buildarr is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# Buildarr is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with Buildarr.
+# If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Test the `from_remote` class method on the Lidarr Media Management Settings configuration model.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from buildarr_lidarr.config.media_management import (
+    ChangeFileDate,
+    ChmodFolder,
+    ColonReplacementFormat,
+    LidarrMediaManagementSettingsConfig as MediaManagementSettings,
+    PropersAndRepacks,
+    RescanArtistFolderAfterRefresh,
+)
+
+from .util import LIDARR_MEDIAMANAGEMENT_CONFIG_DEFAULTS, LIDARR_NAMING_CONFIG_DEFAULTS
+
+API_NAMING_CONFIG = {
+    **LIDARR_NAMING_CONFIG_DEFAULTS,
+    "renameTracks": True,
+    "colonReplacementFormat": 0,  # delete
+}
+
+API_MEDIAMANAGEMENT_CONFIG = {
+    **LIDARR_MEDIAMANAGEMENT_CONFIG_DEFAULTS,
+    "downloadPropersAndRepacks": "preferAndUpgrade",
+    "rescanAfterRefresh": "afterManual",
+    "fileDate": "localAirDate",
+    "recycleBin": "/recycle",
+    "setPermissionsLinux": True,
+    "chmodFolder": "775",
+    "chownGroup": "media",
+}
+
+API_ROOT_FOLDERS = [
+    {"id": 1, "name": "/music", "path": "/music"},
+    {"id": 2, "name": "/audiobooks", "path": "/audiobooks"},
+]
+
+
+def _expect_get_requests(lidarr_api) -> None:
+    lidarr_api.server.expect_ordered_request(
+        "/api/v1/config/naming",
+        method="GET",
+    ).respond_with_json(API_NAMING_CONFIG)
+    lidarr_api.server.expect_ordered_request(
+        "/api/v1/config/mediamanagement",
+        method="GET",
+    ).respond_with_json(API_MEDIAMANAGEMENT_CONFIG)
+    lidarr_api.server.expect_ordered_request(
+        "/api/v1/rootfolder",
+        method="GET",
+    ).respond_with_json(API_ROOT_FOLDERS)
+
+
+def test_types(lidarr_api) -> None:
+    """
+    Check that attributes are decoded from their API values into their local types,
+    as validation is skipped when creating the model from the remote instance.
+    """
+
+    _expect_get_requests(lidarr_api)
+
+    remote = MediaManagementSettings.from_remote(lidarr_api.secrets)
+
+    assert remote.colon_replacement_format is ColonReplacementFormat.delete
+    assert remote.propers_and_repacks is PropersAndRepacks.prefer_and_upgrade
+    assert (
+        remote.rescan_artist_folder_after_refresh
+        is RescanArtistFolderAfterRefresh.after_manual_refresh
+    )
+    assert remote.change_file_date is ChangeFileDate.local_air_date
+    assert remote.chmod_folder is ChmodFolder.drwxrwxr_x
+    assert remote.recycling_bin == "/recycle"
+    assert remote.chown_group == "media"
+    assert isinstance(remote.root_folders, frozenset)
+    assert remote.root_folders == {"/music", "/audiobooks"}
+
+
+@pytest.mark.parametrize("check_unmanaged", [False, True])
+def test_round_trip(lidarr_api, check_unmanaged) -> None:
+    """
+    Check that a configuration created from the values read from the remote instance
+    is up to date with it, and does not result in any update requests.
+    """
+
+    _expect_get_requests(lidarr_api)
+
+    remote = MediaManagementSettings.from_remote(lidarr_api.secrets)
+
+    assert not MediaManagementSettings(**remote.model_dump()).update_remote(
+        tree="lidarr.settings.media_management",
+        secrets=lidarr_api.secrets,
+        remote=remote,
+        check_unmanaged=check_unmanaged,
+    )
+    lidarr_api.server.check_assertions()
@@ -0,0 +1,63 @@
+# Copyright (C) 2024 Callum Dickinson
+#
+# Buildarr is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# Buildarr is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with Buildarr.
+# If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Test the `update_remote` method on the Lidarr Media Management Settings configuration model.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from buildarr_lidarr.config.media_management import (
+    LidarrMediaManagementSettingsConfig as MediaManagementSettings,
+)
+
+from .util import LIDARR_MEDIAMANAGEMENT_CONFIG_DEFAULTS
+
+
+@pytest.mark.parametrize("attr_value", [775, 0o775, "775", "drwxrwxr-x", "drwxrwxr_x"])
+def test_chmod_folder(lidarr_api, attr_value) -> None:
+    """
+    Check that the `chmod_folder` attribute is updated when defined
+    using any supported representation, including a decimal integer.
+    """
+
+    api_mediamanagement_config = {
+        "id": LIDARR_MEDIAMANAGEMENT_CONFIG_DEFAULTS["id"],
+        **{
+            remote_attr: LIDARR_MEDIAMANAGEMENT_CONFIG_DEFAULTS[remote_attr]
+            for _, remote_attr, _ in MediaManagementSettings._mediamanagement_remote_map
+        },
+        "chmodFolder": "775",
+    }
+
+    lidarr_api.server.expect_ordered_request(
+        "/api/v1/config/mediamanagement",
+        method="GET",
+    ).respond_with_json(LIDARR_MEDIAMANAGEMENT_CONFIG_DEFAULTS)
+    lidarr_api.server.expect_ordered_request(
+        "/api/v1/config/mediamanagement/0",
+        method="PUT",
+        json=api_mediamanagement_config,
+    ).respond_with_json(api_mediamanagement_config, status=202)
+
+    assert MediaManagementSettings(
+        chmod_folder=attr_value,  # type: ignore[arg-type]
+    ).update_remote(
+        tree="lidarr.settings.media_management",
+        secrets=lidarr_api.secrets,
+        remote=MediaManagementSettings(),
+    )
+    lidarr_api.server.check_assertions()
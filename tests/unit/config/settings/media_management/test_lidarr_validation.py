@@ -0,0 +1,37 @@
+# Copyright (C) 2024 Callum Dickinson
+#
+# Buildarr is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# Buildarr is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with Buildarr.
+# If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Test validation of attributes on the Lidarr Media Management Settings configuration model.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from pydantic import ValidationError
+
+from buildarr_lidarr.config.media_management import (
+    LidarrMediaManagementSettingsConfig as MediaManagementSettings,
+)
+
+
+@pytest.mark.parametrize("attr_value", [123, "123", "drwxrwxr"])
+def test_chmod_folder_invalid(attr_value) -> None:
+    """
+    Check that an unsupported `chmod_folder` value fails validation.
+    """
+
+    with pytest.raises(ValidationError):
+        MediaManagementSettings(chmod_folder=attr_value)  # type: ignore[arg-type]
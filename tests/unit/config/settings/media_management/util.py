@@ -93,3 +93,56 @@ MEDIAMANAGEMENT_CONFIG_DEFAULTS = {
     "chmodFolder": "755",
     "chownGroup": "",
 }
+
+LIDARR_NAMING_CONFIG_DEFAULTS = {
+    # Uses default values set in the model,
+    # which may be different to the real defaults.
+    # In this case, the model defaults are used.
+    "id": 0,
+    "renameTracks": False,
+    "replaceIllegalCharacters": True,
+    "colonReplacementFormat": 4,  # smart-replace
+    "standardTrackFormat": (
+        "{Album Title} ({Release Year})/"
+        "{Artist Name} - {Album Title} - {track:00} - {Track Title}"
+    ),
+    "multiDiscTrackFormat": (
+        "{Album Title} ({Release Year})/"
+        "{Medium Format} {medium:00}/"
+        "{Artist Name} - {Album Title} - {track:00} - {Track Title}"
+    ),
+    "artistFolderFormat": "{Artist Name}",
+    "includeArtistName": False,
+    "includeAlbumTitle": False,
+    "includeQuality": False,
+    "replaceSpaces": False,
+}
+
+LIDARR_MEDIAMANAGEMENT_CONFIG_DEFAULTS = {
+    # Uses default values set in the model,
+    # which may be different to the real defaults.
+    # In this case, the model defaults are used.
+    "id": 0,
+    # Folders
+    "createEmptyArtistFolders": False,
+    "deleteEmptyFolders": False,
+    # Importing
+    "skipFreeSpaceCheckWhenImporting": False,
+    "minimumFreeSpaceWhenImporting": 100,  # MB
+    "copyUsingHardlinks": True,
+    "importExtraFiles": False,
+    "extraFileExtensions": "srt",
+    # File Management
+    "autoUnmonitorPreviouslyDownloadedTracks": False,
+    "downloadPropersAndRepacks": "doNotPrefer",
+    "watchLibraryForChanges": True,
+    "rescanAfterRefresh": "always",
+    "allowFingerprinting": "newFiles",
+    "fileDate": "none",
+    "recycleBin": "",
+    "recycleBinCleanupDays": 7,
+    # Permissions
+    "setPermissionsLinux": False,
+    "chmodFolder": "755",
+    "chownGroup": "",
+}
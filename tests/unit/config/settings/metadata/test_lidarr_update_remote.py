@@ -0,0 +1,52 @@
+# Copyright (C) 2024 Callum Dickinson
+#
+# Buildarr is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# Buildarr is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with Buildarr.
+# If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Test the `update_remote` method on the Lidarr Metadata Settings configuration model.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from buildarr_lidarr.config.metadata import LidarrMetadataSettingsConfig as MetadataSettings
+
+from .util import LIDARR_METADATA_DEFAULTS
+
+
+@pytest.mark.parametrize("metadata_type", ["kodi_emby", "roksbox", "wdtv"])
+def test_enable(lidarr_api, metadata_type) -> None:
+    """
+    Check that a metadata type with no managed fields can be enabled,
+    and that its fields on the remote instance are passed through unchanged.
+    """
+
+    api_metadata = {**LIDARR_METADATA_DEFAULTS[metadata_type], "enable": True}
+
+    lidarr_api.server.expect_ordered_request(
+        "/api/v1/metadata",
+        method="GET",
+    ).respond_with_json(list(LIDARR_METADATA_DEFAULTS.values()))
+    lidarr_api.server.expect_ordered_request(
+        f"/api/v1/metadata/{api_metadata['id']}",
+        method="PUT",
+        json=api_metadata,
+    ).respond_with_json(api_metadata, status=202)
+
+    assert MetadataSettings(**{metadata_type: {"enable": True}}).update_remote(  # type: ignore[arg-type]
+        tree="lidarr.settings.metadata",
+        secrets=lidarr_api.secrets,
+        remote=MetadataSettings.from_remote(lidarr_api.secrets),
+    )
+    lidarr_api.server.check_assertions()
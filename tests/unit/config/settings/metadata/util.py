@@ -87,3 +87,64 @@ METADATA_DEFAULTS = {
     "roksbox": ROKSBOX_METADATA_DEFAULTS,
     "wdtv": WDTV_METADATA_DEFAULTS,
 }
+
+LIDARR_XBMC_METADATA_DEFAULTS: Dict[str, Any] = {
+    # Uses default values set in the model,
+    # which may be different to the real defaults.
+    # In this case, the model defaults are not used.
+    "id": 0,
+    "name": "Kodi (XBMC) / Emby",
+    "implementationName": "Kodi (XBMC) / Emby",
+    "implementation": "XbmcMetadata",
+    "configContract": "XbmcMetadataSettings",
+    "enable": False,
+    "fields": [
+        {"id": 0, "name": "artistMetadata", "value": False},
+        {"id": 1, "name": "albumMetadata", "value": False},
+        {"id": 2, "name": "artistImages", "value": False},
+        {"id": 3, "name": "albumImages", "value": False},
+    ],
+    "tags": [],
+}
+
+LIDARR_ROKSBOX_METADATA_DEFAULTS: Dict[str, Any] = {
+    # Uses default values set in the model,
+    # which may be different to the real defaults.
+    # In this case, the model defaults are not used.
+    "id": 1,
+    "name": "Roksbox",
+    "implementationName": "Roksbox",
+    "implementation": "RoksboxMetadata",
+    "configContract": "RoksboxMetadataSettings",
+    "enable": False,
+    "fields": [
+        {"id": 0, "name": "trackMetadata", "value": False},
+        {"id": 1, "name": "artistImages", "value": False},
+        {"id": 2, "name": "albumImages", "value": False},
+    ],
+    "tags": [],
+}
+
+LIDARR_WDTV_METADATA_DEFAULTS: Dict[str, Any] = {
+    # Uses default values set in the model,
+    # which may be different to the real defaults.
+    # In this case, the model defaults are not used.
+    "id": 2,
+    "name": "WDTV",
+    "implementationName": "WDTV",
+    "implementation": "WdtvMetadata",
+    "configContract": "WdtvMetadataSettings",
+    "enable": False,
+    "fields": [
+        {"id": 0, "name": "trackMetadata", "value": False},
+        {"id": 1, "name": "artistImages", "value": False},
+        {"id": 2, "name": "albumImages", "value": False},
+    ],
+    "tags": [],
+}
+
+LIDARR_METADATA_DEFAULTS = {
+    "kodi_emby": LIDARR_XBMC_METADATA_DEFAULTS,
+    "roksbox": LIDARR_ROKSBOX_METADATA_DEFAULTS,
+    "wdtv": LIDARR_WDTV_METADATA_DEFAULTS,
+}
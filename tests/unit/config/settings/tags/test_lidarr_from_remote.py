@@ -0,0 +1,61 @@
+# Copyright (C) 2024 Callum Dickinson
+#
+# Buildarr is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# Buildarr is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with Buildarr.
+# If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Test the `from_remote` class method on the Lidarr Tags Settings configuration model.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from buildarr_lidarr.config.tags import LidarrTagsSettingsConfig as TagsSettings
+
+
+@pytest.mark.parametrize("tags", [[], ["music"], ["music", "audiobooks"]])
+def test_definitions(lidarr_api, tags) -> None:
+    """
+    Check that the retrieved tags are decoded into a frozen set of tag names.
+    """
+
+    lidarr_api.server.expect_ordered_request(
+        "/api/v1/tag",
+        method="GET",
+    ).respond_with_json([{"id": i, "label": t} for i, t in enumerate(tags)])
+
+    definitions = TagsSettings.from_remote(lidarr_api.secrets).definitions
+
+    assert isinstance(definitions, frozenset)
+    assert definitions == set(tags)
+
+
+def test_round_trip(lidarr_api) -> None:
+    """
+    Check that a configuration created from the tags read from the remote instance
+    is up to date with it, and does not result in any tags being created.
+    """
+
+    lidarr_api.server.expect_ordered_request(
+        "/api/v1/tag",
+        method="GET",
+    ).respond_with_json([{"id": 1, "label": "music"}, {"id": 2, "label": "audiobooks"}])
+
+    remote = TagsSettings.from_remote(lidarr_api.secrets)
+
+    assert not TagsSettings(**remote.model_dump()).update_remote(
+        tree="lidarr.settings.tags",
+        secrets=lidarr_api.secrets,
+        remote=remote,
+    )
+    lidarr_api.server.check_assertions()
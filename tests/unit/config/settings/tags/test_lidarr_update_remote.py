@@ -0,0 +1,56 @@
+# Copyright (C) 2024 Callum Dickinson
+#
+# Buildarr is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# Buildarr is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with Buildarr.
+# If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Test the `update_remote` method on the Lidarr Tags Settings configuration model.
+"""
+
+from __future__ import annotations
+
+import logging
+
+from buildarr_lidarr.config.tags import LidarrTagsSettingsConfig as TagsSettings
+
+
+def test_create_missing(lidarr_api, caplog) -> None:
+    """
+    Check that only tags missing from the remote instance are created,
+    and that every tag is logged with its index in the sorted definitions.
+    """
+
+    lidarr_api.server.expect_ordered_request(
+        "/api/v1/tag",
+        method="GET",
+    ).respond_with_json([{"id": 1, "label": "music"}])
+    lidarr_api.server.expect_ordered_request(
+        "/api/v1/tag",
+        method="POST",
+        json={"label": "audiobooks"},
+    ).respond_with_json({"id": 2, "label": "audiobooks"}, status=201)
+
+    with caplog.at_level(logging.DEBUG, logger="buildarr_lidarr.config.tags"):
+        assert TagsSettings(definitions={"music", "audiobooks"}).update_remote(  # type: ignore[arg-type]
+            tree="lidarr.settings.tags",
+            secrets=lidarr_api.secrets,
+            remote=TagsSettings.from_remote(lidarr_api.secrets),
+        )
+    lidarr_api.server.check_assertions()
+    assert [
+        record.getMessage()
+        for record in caplog.records
+        if record.name == "buildarr_lidarr.config.tags"
+    ] == [
+        "lidarr.settings.tags.definitions[0]: 'audiobooks' -> (created)",
+        "lidarr.settings.tags.definitions[1]: 'music' (exists)",
+    ]
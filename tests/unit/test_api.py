@@ -0,0 +1,91 @@
+# Copyright (C) 2024 Callum Dickinson
+#
+# Buildarr is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# Buildarr is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with Buildarr.
+# If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Test the Lidarr plugin API functions.
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+import sys
+
+import pytest
+
+from buildarr_lidarr import api
+from buildarr_lidarr.exceptions import LidarrAPIError
+
+
+def test_json_loads_replaced(lidarr_api, monkeypatch) -> None:
+    """
+    Check that API responses are decoded using the configured `json_loads` function.
+    """
+
+    decoded = []
+
+    def json_loads(content: bytes) -> object:
+        decoded.append(content)
+        return json.loads(content)
+
+    monkeypatch.setattr(api, "json_loads", json_loads)
+    lidarr_api.server.expect_ordered_request(
+        "/api/v1/tag",
+        method="GET",
+    ).respond_with_json([{"id": 1, "label": "music"}])
+
+    assert api.api_get(lidarr_api.secrets, "/api/v1/tag") == [{"id": 1, "label": "music"}]
+    assert len(decoded) == 1
+    assert isinstance(decoded[0], bytes)
+
+
+def test_api_error_json_loads_replaced(lidarr_api, monkeypatch) -> None:
+    """
+    Check that error responses are also decoded using the configured `json_loads` function.
+    """
+
+    api_errors = [{"propertyName": "Label", "errorMessage": "Invalid label"}]
+    decoded = []
+
+    def json_loads(content: bytes) -> object:
+        decoded.append(content)
+        return json.loads(content)
+
+    monkeypatch.setattr(api, "json_loads", json_loads)
+    lidarr_api.server.expect_ordered_request(
+        "/api/v1/tag",
+        method="POST",
+    ).respond_with_json(api_errors, status=400)
+
+    with pytest.raises(LidarrAPIError, match="Label: Invalid label"):
+        api.api_post(lidarr_api.secrets, "/api/v1/tag", {"label": ""})
+    # Decoded once when checking the response, and once when generating the error message.
+    assert [json.loads(content) for content in decoded] == [api_errors, api_errors]
+
+
+def test_json_loads_stdlib_fallback(monkeypatch) -> None:
+    """
+    Check that `json.loads` from the standard library is used to decode API responses
+    when `orjson` is not installed.
+    """
+
+    try:
+        with monkeypatch.context() as m:
+            # Setting the module to `None` makes importing it raise `ImportError`.
+            m.setitem(sys.modules, "orjson", None)
+            importlib.reload(api)
+            assert api.orjson is None
+            assert api.json_loads is json.loads
+    finally:
+        importlib.reload(api)